@@ -0,0 +1,39 @@
+#!/bin/bash
+# Tunes the OS for lossless reception of the camera (USB3) and motion capture (NatNet over UDP) streams.
+# Needs root, the settings are not persistent and have to be reapplied after a reboot.
+#
+# Usage:
+#     sudo ./scripts/tune_system.sh [network interface connected to the Motive PC]
+#
+# Author:
+#     Theodor Kapler <theodor.kapler@student.kit.edu>
+
+set -e
+IFACE=$1
+
+# IDS USB3 camera: The default usbfs memory (16 MB) is too small for the announced buffers and leads to incomplete frames
+echo 1000 > /sys/module/usbcore/parameters/usbfs_memory_mb
+
+# NatNet UDP stream: Larger socket buffers and backlog, so that no packets are dropped while Python is busy
+sysctl -w net.core.rmem_max=134217728
+sysctl -w net.core.rmem_default=33554432
+sysctl -w net.core.optmem_max=4194304
+sysctl -w net.core.netdev_max_backlog=250000
+sysctl -w net.core.netdev_budget=600
+
+if [ -n "$IFACE" ]; then
+    # Don't drop packets from the Motive PC because of reverse path filtering
+    sysctl -w net.ipv4.conf.all.rp_filter=0
+    sysctl -w "net.ipv4.conf.$IFACE.rp_filter=0"
+
+    # Maximize the RX ring buffer of the NIC (falls back to the current size if 4096 is not supported)
+    ethtool -G "$IFACE" rx 4096 || echo "Could not set RX ring size of $IFACE to 4096, see 'ethtool -g $IFACE' for the maximum."
+
+    # Report the CPUs local to the NIC, which are the best choice to pin the streams to
+    NUMA_NODE=$(cat "/sys/class/net/$IFACE/device/numa_node" 2>/dev/null || echo -1)
+    if [ "$NUMA_NODE" -ge 0 ]; then
+        echo "$IFACE is on NUMA node $NUMA_NODE with CPUs $(cat /sys/devices/system/node/node$NUMA_NODE/cpulist)"
+    else
+        echo "$IFACE has no NUMA affinity, all CPUs are equally close."
+    fi
+fi
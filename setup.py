@@ -6,9 +6,13 @@ setup(
     packages=find_packages(include=['streams', 'streams.*']),
     install_requires=[
         'numpy',
-        'opencv-python',
+        'opencv-python>=4.10',
         'matplotlib',
         'scipy',
         'ids_peak',
     ],
+    extras_require={
+        'numba': ['numba'],
+        'kornia': ['kornia-rs'],
+    },
 )
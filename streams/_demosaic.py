@@ -0,0 +1,285 @@
+"""
+Demosaicing kernels for the raw Bayer frames of the IDS camera.
+Contains Numba kernels, that fuse the Bayer to BGR conversion with the downscaling (bilinear and Malvar-He-Cutler),
+and vectorized NumPy equivalents, which are used instead if Numba is not installed.
+
+Author:
+    Theodor Kapler <theodor.kapler@student.kit.edu>
+"""
+
+from functools import lru_cache
+import numpy as np
+
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+BLOCK_ROWS = 32 # Output rows processed per block, so that the touched source rows stay in L1/L2
+
+
+def set_num_threads(n_threads):
+    """
+    Limits the threads of the parallel kernels, e.g. to the number of cores the camera process is pinned to.
+    Numba starts one thread per host CPU by default, which would otherwise oversubscribe the pinned cores.
+    """
+    if NUMBA_AVAILABLE:
+        numba.set_num_threads(max(1, min(n_threads, numba.config.NUMBA_NUM_THREADS)))
+
+
+@njit(inline="always")
+def _reflect(i, n):
+    # Reflect101 border handling, keeps the CFA phase of the mirrored pixel
+    if i < 0:
+        return -i
+    if i >= n:
+        return 2 * n - 2 - i
+    return i
+
+
+@njit(inline="always")
+def _bilinear_pixel(bayer, out, oy, ox, sy, ynn, yn, ys, yss, sx, width):
+    # Demosaics the source pixel (sy, sx) bilinearly into the output pixel (oy, ox), yn and ys are the reflected rows above and below
+    # (ynn and yss are unused, they keep the signature of _mhc_pixel)
+    xw = sx - 1 if sx > 0 else 1
+    xe = sx + 1 if sx < width - 1 else width - 2
+
+    c = np.int32(bayer[sy, sx])
+    n = np.int32(bayer[yn, sx])
+    s = np.int32(bayer[ys, sx])
+    w = np.int32(bayer[sy, xw])
+    e = np.int32(bayer[sy, xe])
+
+    if (sy & 1) == 0 and (sx & 1) == 0: # R pixel
+        r = c
+        g = (n + s + w + e + 2) >> 2
+        b = (np.int32(bayer[yn, xw]) + np.int32(bayer[yn, xe]) +
+             np.int32(bayer[ys, xw]) + np.int32(bayer[ys, xe]) + 2) >> 2
+    elif (sy & 1) == 0: # G pixel in a R row
+        r = (w + e + 1) >> 1
+        g = c
+        b = (n + s + 1) >> 1
+    elif (sx & 1) == 0: # G pixel in a B row
+        r = (n + s + 1) >> 1
+        g = c
+        b = (w + e + 1) >> 1
+    else: # B pixel
+        r = (np.int32(bayer[yn, xw]) + np.int32(bayer[yn, xe]) +
+             np.int32(bayer[ys, xw]) + np.int32(bayer[ys, xe]) + 2) >> 2
+        g = (n + s + w + e + 2) >> 2
+        b = c
+
+    out[oy, ox, 0] = b
+    out[oy, ox, 1] = g
+    out[oy, ox, 2] = r
+
+
+@njit(inline="always")
+def _mhc_pixel(bayer, out, oy, ox, sy, ynn, yn, ys, yss, sx, width):
+    # Demosaics the source pixel (sy, sx) with Malvar-He-Cutler into the output pixel (oy, ox), ynn to yss are the reflected rows around sy
+    xww = _reflect(sx - 2, width)
+    xw = _reflect(sx - 1, width)
+    xe = _reflect(sx + 1, width)
+    xee = _reflect(sx + 2, width)
+
+    c = np.int32(bayer[sy, sx])
+    cross1 = np.int32(bayer[yn, sx]) + np.int32(bayer[ys, sx]) + np.int32(bayer[sy, xw]) + np.int32(bayer[sy, xe])
+    diag = (np.int32(bayer[yn, xw]) + np.int32(bayer[yn, xe]) +
+            np.int32(bayer[ys, xw]) + np.int32(bayer[ys, xe]))
+    vert1 = np.int32(bayer[yn, sx]) + np.int32(bayer[ys, sx])
+    hor1 = np.int32(bayer[sy, xw]) + np.int32(bayer[sy, xe])
+    vert2 = np.int32(bayer[ynn, sx]) + np.int32(bayer[yss, sx])
+    hor2 = np.int32(bayer[sy, xww]) + np.int32(bayer[sy, xee])
+
+    # Filters of Malvar-He-Cutler
+    g_at_rb = 8 * c + 4 * cross1 - 2 * (vert2 + hor2)
+    rb_at_g_hor = 10 * c + 8 * hor1 - 2 * diag - 2 * hor2 + vert2 # Neighbors of the wanted color left and right
+    rb_at_g_vert = 10 * c + 8 * vert1 - 2 * diag - 2 * vert2 + hor2 # Neighbors of the wanted color above and below
+    rb_at_br = 12 * c + 4 * diag - 3 * (vert2 + hor2)
+
+    if (sy & 1) == 0 and (sx & 1) == 0: # R pixel
+        r = 16 * c
+        g = g_at_rb
+        b = rb_at_br
+    elif (sy & 1) == 0: # G pixel in a R row
+        r = rb_at_g_hor
+        g = 16 * c
+        b = rb_at_g_vert
+    elif (sx & 1) == 0: # G pixel in a B row
+        r = rb_at_g_vert
+        g = 16 * c
+        b = rb_at_g_hor
+    else: # B pixel
+        r = rb_at_br
+        g = g_at_rb
+        b = 16 * c
+
+    out[oy, ox, 0] = min(max((b + 8) >> 4, 0), 255)
+    out[oy, ox, 1] = min(max((g + 8) >> 4, 0), 255)
+    out[oy, ox, 2] = min(max((r + 8) >> 4, 0), 255)
+
+
+@lru_cache(maxsize=4)
+def specialize_kernel(bayer_shape, out_shape, edge_aware=False):
+    """
+    Compiles the fused kernel for a fixed resolution, as the camera resolution doesn't change while streaming.
+    The sizes are closure constants for Numba, so the index divisions become multiplications, the row strides are known
+    and the border handling can be folded at compile time. Closures can't be cached on disk, so this compiles on every start.
+
+    Args:
+        bayer_shape (tuple): The shape (H, W) of the raw Bayer frames.
+        out_shape (tuple): The shape (OH, OW, 3) of the output frames.
+        edge_aware (bool): Whether to demosaic with Malvar-He-Cutler instead of bilinearly.
+
+    Returns:
+        callable: The kernel with the signature of bayer_bg_to_bgr_resize.
+    """
+    if not NUMBA_AVAILABLE:
+        return bayer_bg_to_bgr_resize_mhc_numpy if edge_aware else bayer_bg_to_bgr_resize_numpy
+
+    height, width = bayer_shape
+    out_height, out_width = out_shape[0], out_shape[1]
+    n_blocks = (out_height + BLOCK_ROWS - 1) // BLOCK_ROWS
+    demosaic_pixel = _mhc_pixel if edge_aware else _bilinear_pixel
+
+    @njit(parallel=True, fastmath=True)
+    def kernel(bayer, out):
+        for block in prange(n_blocks):
+            for oy in range(block * BLOCK_ROWS, min((block + 1) * BLOCK_ROWS, out_height)):
+                sy = oy * height // out_height
+                # Reflect at the border (reflect101 keeps the CFA phase of the neighbors)
+                ynn = _reflect(sy - 2, height)
+                yn = _reflect(sy - 1, height)
+                ys = _reflect(sy + 1, height)
+                yss = _reflect(sy + 2, height)
+                for ox in range(out_width):
+                    demosaic_pixel(bayer, out, oy, ox, sy, ynn, yn, ys, yss, ox * width // out_width, width)
+
+    # Compile now for the C contiguous uint8 frames of the camera and the shared ring, instead of at the first frame
+    kernel(np.zeros(bayer_shape, dtype=np.uint8), np.zeros(out_shape, dtype=np.uint8))
+    return kernel
+
+
+def bayer_bg_to_bgr_resize(bayer, out):
+    """
+    Converts a Bayer frame to BGR and resizes it in a single pass, without materializing the full resolution BGR frame.
+    Each output pixel is demosaiced bilinearly from the 3x3 Bayer neighborhood of its corresponding source pixel.
+    The pattern is "BayerBG" in OpenCV naming, i.e. the top left 2x2 block of the sensor is R G / G B.
+    Uses the kernel compiled by specialize_kernel for the shapes of bayer and out.
+
+    Args:
+        bayer (numpy.ndarray): The raw Bayer frame of shape (H, W) and dtype uint8.
+        out (numpy.ndarray): The preallocated output frame of shape (OH, OW, 3) and dtype uint8.
+    """
+    specialize_kernel(bayer.shape, out.shape)(bayer, out)
+
+
+def bayer_bg_to_bgr_resize_mhc(bayer, out):
+    """
+    Same as bayer_bg_to_bgr_resize, but demosaics with the edge-aware Malvar-He-Cutler filters.
+    The 5x5 filters are only evaluated at the sampled output pixels, so the full resolution frame is never filtered.
+    The filter weights are scaled by 16 to integers.
+
+    Args:
+        bayer (numpy.ndarray): The raw Bayer frame of shape (H, W) and dtype uint8.
+        out (numpy.ndarray): The preallocated output frame of shape (OH, OW, 3) and dtype uint8.
+    """
+    specialize_kernel(bayer.shape, out.shape, True)(bayer, out)
+
+
+# Demosaicing filters for the NumPy path, indexed by CFA phase (R, G in R row, G in B row, B) and output channel (B, G, R)
+_CENTER3 = np.array([[0, 0, 0], [0, 1, 0], [0, 0, 0]], dtype=np.float32)
+_CROSS3 = np.array([[0, 1, 0], [1, 0, 1], [0, 1, 0]], dtype=np.float32) / 4
+_DIAG3 = np.array([[1, 0, 1], [0, 0, 0], [1, 0, 1]], dtype=np.float32) / 4
+_HOR3 = np.array([[0, 0, 0], [1, 0, 1], [0, 0, 0]], dtype=np.float32) / 2
+_VERT3 = _HOR3.T
+BILINEAR_FILTERS = np.stack([
+    np.stack([_DIAG3, _CROSS3, _CENTER3]),
+    np.stack([_VERT3, _CENTER3, _HOR3]),
+    np.stack([_HOR3, _CENTER3, _VERT3]),
+    np.stack([_CENTER3, _CROSS3, _DIAG3]),
+])
+
+_CENTER5 = np.zeros((5, 5), dtype=np.float32)
+_CENTER5[2, 2] = 1
+_G_AT_RB = np.array([[ 0, 0, -1, 0,  0],
+                     [ 0, 0,  2, 0,  0],
+                     [-1, 2,  4, 2, -1],
+                     [ 0, 0,  2, 0,  0],
+                     [ 0, 0, -1, 0,  0]], dtype=np.float32) / 8
+_RB_AT_G_HOR = np.array([[ 0,  0, 0.5,  0,  0],
+                         [ 0, -1,   0, -1,  0],
+                         [-1,  4,   5,  4, -1],
+                         [ 0, -1,   0, -1,  0],
+                         [ 0,  0, 0.5,  0,  0]], dtype=np.float32) / 8
+_RB_AT_G_VERT = _RB_AT_G_HOR.T
+_RB_AT_BR = np.array([[   0, 0, -1.5, 0,    0],
+                      [   0, 2,    0, 2,    0],
+                      [-1.5, 0,    6, 0, -1.5],
+                      [   0, 2,    0, 2,    0],
+                      [   0, 0, -1.5, 0,    0]], dtype=np.float32) / 8
+MHC_FILTERS = np.stack([
+    np.stack([_RB_AT_BR, _G_AT_RB, _CENTER5]),
+    np.stack([_RB_AT_G_VERT, _CENTER5, _RB_AT_G_HOR]),
+    np.stack([_RB_AT_G_HOR, _CENTER5, _RB_AT_G_VERT]),
+    np.stack([_CENTER5, _G_AT_RB, _RB_AT_BR]),
+])
+
+
+@lru_cache(maxsize=8)
+def _sample_layout(bayer_shape, out_shape, radius):
+    """
+    Precomputes the flat Bayer indices of the filter window of every sampled source pixel, split by its CFA phase.
+    The windows are reflected at the border (reflect101, keeps the CFA phase of the mirrored pixels), so no padded copy
+    of the frame is needed. Computed once per resolution, as the camera resolution is fixed while streaming.
+    """
+    height, width = bayer_shape
+    ys = np.arange(out_shape[0]) * height // out_shape[0]
+    xs = np.arange(out_shape[1]) * width // out_shape[1]
+    phases = (ys[:, None] & 1) * 2 + (xs[None, :] & 1)
+    offsets = np.arange(-radius, radius + 1)
+    layout = []
+    for phase in range(4):
+        oy, ox = np.nonzero(phases == phase)
+        rows = np.abs(ys[oy, None] + offsets) # Reflect at the top and the left with abs, at the bottom and the right below
+        rows = np.where(rows >= height, 2 * height - 2 - rows, rows)
+        cols = np.abs(xs[ox, None] + offsets)
+        cols = np.where(cols >= width, 2 * width - 2 - cols, cols)
+        windows = (rows[:, :, None] * width + cols[:, None, :]).reshape(len(oy), -1).astype(np.intp)
+        layout.append((oy, ox, windows))
+    return layout
+
+
+def _demosaic_resize_numpy(bayer, out, filters):
+    """
+    Applies the per phase demosaicing filters at the sampled source pixels with numpy.
+    """
+    flat_bayer = bayer.reshape(-1)
+    flat_filters = filters.reshape(4, 3, -1)
+    for phase, (oy, ox, windows) in enumerate(_sample_layout(bayer.shape, out.shape[:2], filters.shape[-1] // 2)):
+        values = flat_bayer[windows].astype(np.float32) @ flat_filters[phase].T
+        out[oy, ox] = np.clip(np.floor(values + 0.5), 0, 255)
+
+
+def bayer_bg_to_bgr_resize_numpy(bayer, out):
+    """
+    NumPy version of bayer_bg_to_bgr_resize.
+    """
+    _demosaic_resize_numpy(bayer, out, BILINEAR_FILTERS)
+
+
+def bayer_bg_to_bgr_resize_mhc_numpy(bayer, out):
+    """
+    NumPy version of bayer_bg_to_bgr_resize_mhc.
+    """
+    _demosaic_resize_numpy(bayer, out, MHC_FILTERS)
+
+
+if not NUMBA_AVAILABLE:
+    bayer_bg_to_bgr_resize = bayer_bg_to_bgr_resize_numpy
+    bayer_bg_to_bgr_resize_mhc = bayer_bg_to_bgr_resize_mhc_numpy
@@ -0,0 +1,39 @@
+"""
+Helpers to pin the streaming threads to CPU cores and to give them real-time priority (Linux only).
+Failures (missing permissions, other platforms) are reported and ignored, as the streams also work without.
+
+Author:
+    Theodor Kapler <theodor.kapler@student.kit.edu>
+"""
+
+import os
+
+
+def pin_thread(thread_id, cores):
+    """
+    Restricts a thread to the given cores, so that it doesn't share its L1/L2 cache with the other streaming threads.
+
+    Args:
+        thread_id (int): The native thread id (0 for the calling thread). Threads created by it inherit the affinity.
+        cores (int or iterable of int): The core(s) to pin the thread to.
+    """
+    cores = {cores} if isinstance(cores, int) else set(cores)
+    try:
+        os.sched_setaffinity(thread_id, cores)
+    except (AttributeError, OSError) as e:
+        print(f"Failed to pin thread {thread_id} to cores {sorted(cores)}: {e}")
+
+
+def set_realtime(thread_id, priority=50):
+    """
+    Schedules a thread with SCHED_FIFO, so that it isn't preempted by normal threads.
+    Requires root or CAP_SYS_NICE (e.g. "sudo setcap cap_sys_nice+ep $(readlink -f $(which python))").
+
+    Args:
+        thread_id (int): The native thread id (0 for the calling thread). Threads created by it inherit the policy.
+        priority (int): The SCHED_FIFO priority (1-99).
+    """
+    try:
+        os.sched_setscheduler(thread_id, os.SCHED_FIFO, os.sched_param(priority))
+    except (AttributeError, OSError) as e:
+        print(f"Failed to set SCHED_FIFO for thread {thread_id}: {e}")
@@ -1,51 +1,289 @@
 """
 Camera streaming module for an IDS camera.
-Contains wrapper class IDSStream, that wraps the IDS Peak API
+Contains wrapper class IDSStream, that wraps the IDS Peak API.
+The camera is run in a separate process (CameraWorker), which publishes the frames through shared memory,
+so that demosaicing doesn't compete for the GIL with the consumer and the NatNet client threads.
 
 Author:
     Theodor Kapler <theodor.kapler@student.kit.edu>
 """
 
-import threading
+import ctypes
+import math
+import multiprocessing as mp
+import time
+from multiprocessing import shared_memory
 import cv2
+import numpy as np
 import torch
 from datetime import timedelta
 from ids_peak import ids_peak
 from ids_peak import ids_peak_ipl_extension
+from ._demosaic import NUMBA_AVAILABLE, set_num_threads, specialize_kernel
+from ._scheduling import pin_thread, set_realtime
+
+try:
+    import kornia_rs # Optional SIMD resizer (fast_image_resize)
+except ImportError:
+    kornia_rs = None
+
+# Make sure OpenCV dispatches to its SIMD (e.g. AVX2) kernels
+cv2.setUseOptimized(True)
+
+RING_SIZE = 3 # Reusable output frames: one being written, one published and one spare for a consumer that is still copying
+HEADER_SIZE = RING_SIZE + 2 # int64 header of the shared memory: the raw timestamp of each slot, the published slot index and the unread flag
+retained_segments = [] # Stopped shared rings that frames returned with copy=False still use, closed once those are released
+
+
+def map_shared_ring(buf, frame_shape):
+    """
+    Maps the shared memory layout with numpy views, which is the same in the camera and the consumer process.
+
+    Returns:
+        numpy.ndarray: The raw camera timestamps in nanoseconds of each slot.
+        numpy.ndarray: The published slot index as single element array (-1 until the first frame).
+        numpy.ndarray: The unread flag as single element array, set when a frame is published and cleared when it is read.
+        numpy.ndarray: The frames of shape (RING_SIZE, *frame_shape).
+    """
+    # np.frombuffer keeps the buffer exported while a view exists, so the mapping can't be closed under a live view
+    header = np.frombuffer(buf, dtype=np.int64, count=HEADER_SIZE)
+    frames = np.frombuffer(buf, dtype=np.uint8, count=RING_SIZE * math.prod(frame_shape), offset=header.nbytes)
+    frames = frames.reshape(RING_SIZE, *frame_shape)
+    return header[:RING_SIZE], header[RING_SIZE:RING_SIZE + 1], header[RING_SIZE + 1:], frames
+
+
+def close_segment(shm):
+    """
+    Closes the shared memory mapping, unless numpy views still use it.
+
+    Returns:
+        bool: Whether the mapping was closed.
+    """
+    try:
+        shm.close()
+        return True
+    except BufferError:
+        return False
+
+
+def camera_main(config, conn, running):
+    """
+    Entry point of the camera process.
+    """
+    CameraWorker(**config).run(conn, running)
+
 
 class IDSStream:
     """
     A class to stream images from an IDS camera in the background.
     """
 
-    def __init__(self, frame_rate=30, exposure_time=10000, resize=(500, 500)):
+    def __init__(self, frame_rate=30, exposure_time=10000, resize=(500, 500), backend="cpu", color_mode="bgr", resizer="opencv", edge_aware=False, skip_unread=False,
+                 camera_cores=None, realtime_priority=None):
+        if backend not in ("cpu", "cuda", "numba"):
+            raise ValueError(f"Unknown backend '{backend}', expected 'cpu', 'cuda' or 'numba'.")
+        if color_mode not in ("bgr", "gray"):
+            raise ValueError(f"Unknown color mode '{color_mode}', expected 'bgr' or 'gray'.")
+        if backend == "numba" and color_mode == "gray":
+            raise ValueError("The numba backend only supports color_mode='bgr'.")
+        if edge_aware and color_mode == "gray":
+            raise ValueError("edge_aware is only supported with color_mode='bgr'.")
+        if resizer not in ("opencv", "kornia"):
+            raise ValueError(f"Unknown resizer '{resizer}', expected 'opencv' or 'kornia'.")
+        if resizer == "kornia":
+            if kornia_rs is None:
+                raise ImportError("resizer='kornia' requires the kornia-rs package.")
+            if backend != "cpu" or color_mode != "bgr":
+                raise ValueError("resizer='kornia' is only supported with backend='cpu' and color_mode='bgr'.")
+
+        if backend == "numba" and not NUMBA_AVAILABLE:
+            # The NumPy versions of the fused kernels are too slow to keep up with the camera
+            print("Numba is not installed, using backend='cpu' instead.")
+            backend = "cpu"
+
         # Member variables to control the streaming
         self.frame_rate = frame_rate
         self.exposure_time = exposure_time
         self.resize = resize
+        self.backend = backend
+        self.color_mode = color_mode
+        self.resizer = resizer
+        self.edge_aware = edge_aware
+        self.skip_unread = skip_unread # If set, no frames are processed while the published one wasn't read yet
+        if isinstance(camera_cores, int):
+            camera_cores = {camera_cores}
+        self.camera_cores = set(camera_cores) if camera_cores is not None else None # Cores the camera process is pinned to, e.g. on the NUMA node of the NIC
+        self.realtime_priority = realtime_priority # SCHED_FIFO priority of the camera process, None keeps the default scheduling
+
+        self.shm = None
+
+        # Start the camera process. It is spawned (not forked), as neither the IDS library nor CUDA survive a fork
+        ctx = mp.get_context("spawn")
+        self.running = ctx.Event()
+        self.running.set()
+        conn, child_conn = ctx.Pipe()
+        config = {"frame_rate": frame_rate, "exposure_time": exposure_time, "resize": resize,
+                  "backend": backend, "color_mode": color_mode, "resizer": resizer, "edge_aware": edge_aware,
+                  "skip_unread": skip_unread, "camera_cores": self.camera_cores, "realtime_priority": realtime_priority}
+        self.process = ctx.Process(target=camera_main, args=(config, child_conn, self.running), daemon=True)
+        self.process.start()
+        child_conn.close() # Only the camera process holds this end now, so its exit closes the pipe
+
+        # The camera process reports the frame shape once the camera is opened, then the shared ring is created for it
+        frame_shape = None
+        start_time = time.time()
+        try:
+            while time.time() - start_time < 30:
+                if conn.poll(timeout=0.1):
+                    frame_shape = conn.recv()
+                    break
+                if not self.process.is_alive():
+                    break
+        except EOFError: # The camera process exited without reporting
+            pass
+        if frame_shape is None:
+            conn.close()
+            self.stop()
+            raise RuntimeError("Failed to start IDS camera stream.")
+        self.shm = shared_memory.SharedMemory(create=True, size=HEADER_SIZE * 8 + RING_SIZE * math.prod(frame_shape))
 
         # Member variables to store the latest data
+        # The camera process fills the ring slot after the published one and only then publishes its index,
+        # so a consumer that reads the index once always gets a consistent frame and timestamp
         self.timing_offset = None
-        self.frame = None
-        self.info = {"timestamp": None, "is_test": False}
+        self.timestamps, self.publish_idx, self.unread, self.frame_buffers = map_shared_ring(self.shm.buf, frame_shape)
+        self.publish_idx[0] = -1
+        self.unread[0] = 0
+        try:
+            conn.send(self.shm.name)
+        except OSError: # BrokenPipeError if the camera process died in the meantime
+            self.stop()
+            raise RuntimeError("Failed to start IDS camera stream.")
+        finally:
+            conn.close()
 
-        # Initialize camera streaming in a separate thread
-        self.running = True
-        self.thread = threading.Thread(target=self.update_loop, daemon=True)
-        self.thread.start()
+        # Wait for the first frame
+        start_time = time.time()
+        while self.publish_idx[0] < 0:
+            if not self.process.is_alive() or time.time() - start_time > 10:
+                self.stop()
+                raise RuntimeError("No frame received from the IDS camera.")
+            time.sleep(0.001)
 
     def __len__(self):
         # Arbitrary large number as we don't know the length of a stream
         return 100_000_000  
 
     def start_timing(self):
-        self.timing_offset = self.info["timestamp"]
+        self.timing_offset = int(self.timestamps[self.publish_idx[0]])
 
-    def update_loop(self):
+    def getnext(self, return_tensor=True, copy=True, as_timedelta=True):
         """
-        Internal method to handle camera initialization and image streaming.
+        Returns the next frame and its metadata.
+        The timestamp is a timedelta, or the raw integer nanoseconds if as_timedelta=False.
+        The frames are written into a ring of preallocated buffers, so with copy=False the returned array is the ring slot itself,
+        which is overwritten RING_SIZE - 1 frames later and has to be copied if it is retained.
+        The slot stays mapped while the array exists, also after stop(), but then holds the last frame of the stream.
+        The tensor is always a copy on the GPU, so no additional host copy is made for it.
+        With skip_unread=True, the camera process doesn't process frames while the published one is unread.
+        The published frame can then be as old as the time since the previous call, so it is marked as read
+        and the next published frame is waited for, which is at most one frame period old.
+        """    
+        if self.skip_unread:
+            idx = self.publish_idx[0]
+            self.unread[0] = 0
+            start_time = time.time()
+            while self.publish_idx[0] == idx:
+                if not self.process.is_alive() or time.time() - start_time > 1:
+                    raise RuntimeError("No frame received from the IDS camera.")
+                time.sleep(0.001)
+        idx = self.publish_idx[0]
+        frame = self.frame_buffers[idx]
+        if copy and not return_tensor:
+            frame = frame.copy()
+        timestamp = int(self.timestamps[idx])
+        if not self.skip_unread:
+            self.unread[0] = 0 # With skip_unread the frame stays unread, so frames are skipped until the next call
+        if self.timing_offset is not None:
+            timestamp = timestamp - self.timing_offset
+        if as_timedelta:
+            timestamp = timedelta(microseconds=timestamp // 1000) # Convert nanoseconds to microseconds
+        info = {"timestamp": timestamp, "is_test": False}
+        if return_tensor:
+            frame = torch.from_numpy(frame)
+            frame = frame.unsqueeze(0) if frame.ndim == 2 else frame.permute(2, 0, 1)
+            frame = frame.cuda().float() / 255.0
+        return frame, info
+    
+    def get_image_size(self):
+        frame = self.getnext()[0]
+        return frame.shape[-2], frame.shape[-1]
+
+    def stop(self):
+        self.running.clear()
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+        if self.shm is not None:
+            self.timestamps = self.publish_idx = self.unread = self.frame_buffers = None
+            self.shm.unlink()
+            retained_segments[:] = [shm for shm in retained_segments if not close_segment(shm)]
+            if not close_segment(self.shm):
+                retained_segments.append(self.shm)
+            self.shm = None
+
+
+class CameraWorker:
+    """
+    Runs the IDS camera in its own process and publishes the processed frames into the shared ring of IDSStream.
+    """
+
+    def __init__(self, frame_rate, exposure_time, resize, backend, color_mode, resizer, edge_aware, skip_unread,
+                 camera_cores=None, realtime_priority=None):
+        self.frame_rate = frame_rate
+        self.exposure_time = exposure_time
+        self.resize = resize
+        self.backend = backend
+        self.color_mode = color_mode
+        self.resizer = resizer
+        self.edge_aware = edge_aware
+        self.skip_unread = skip_unread
+        self.camera_cores = camera_cores
+        self.realtime_priority = realtime_priority
+
+        # The sensor is "BayerRG" in GenICam naming, which corresponds to "BayerBG" in OpenCV naming
+        # (OpenCV names the pattern starting at pixel (1, 1)).
+        # Grayscale writes only a third of the output bytes and has a dedicated, faster kernel.
+        # The edge-aware variants avoid the zipper artifacts of bilinear demosaicing at edges.
+        if color_mode == "gray":
+            self.demosaic_code = cv2.COLOR_BayerBG2GRAY
+        elif edge_aware:
+            self.demosaic_code = cv2.COLOR_BayerBG2BGR_EA
+        else:
+            self.demosaic_code = cv2.COLOR_BayerBG2BGR
+
+        self.shm = None
+        self.frame_buffers = [] # Ring of reusable frames in shared memory
+        self.full_res_buffer = None # Full resolution intermediate of the cpu backend
+        self.numba_kernel = None # Fused kernel of the numba backend, compiled for the camera resolution
+
+    def run(self, conn, running):
+        """
+        Handles camera initialization and image streaming until running is cleared.
         Inspired by the example from the IDS peak library at https://pypi.org/project/ids-peak/
+
+        Args:
+            conn (multiprocessing.connection.Connection): Pipe to IDSStream, used to send the frame shape and receive the shared memory name.
+            running (multiprocessing.Event): Is cleared by IDSStream to stop the stream. The stream also stops if the parent process exits.
         """
+        # Pin and prioritize the process before the IDS library starts its threads, so that they inherit both
+        if self.camera_cores is not None:
+            pin_thread(0, self.camera_cores)
+            if self.backend == "numba":
+                set_num_threads(len(self.camera_cores)) # Otherwise one (possibly SCHED_FIFO) worker per host CPU shares the pinned cores
+        if self.realtime_priority is not None:
+            set_realtime(0, self.realtime_priority)
+
         ids_peak.Library.Initialize()
         device_manager = ids_peak.DeviceManager.Instance()
 
@@ -53,7 +291,7 @@ class IDSStream:
             device_manager.Update()
             if device_manager.Devices().empty():
                 print("No IDS camera found.")
-                self.running = False
+                conn.send(None)
                 return
 
             device = device_manager.Devices()[0].OpenDevice(ids_peak.DeviceAccessType_Control)
@@ -68,12 +306,22 @@ class IDSStream:
             remote_nodemap.FindNode("ChunkSelector").SetCurrentEntry("Timestamp")
             remote_nodemap.FindNode("ChunkEnable").SetValue(True)
 
+            # Prepare GPU resources and output frames before the acquisition is started
+            if self.backend == "cuda":
+                self.setup_cuda()
+            bayer_shape = (remote_nodemap.FindNode("Height").Value(), remote_nodemap.FindNode("Width").Value())
+            self.allocate_frame_buffers(bayer_shape, conn)
+
             # Prepare data stream
             data_stream = device.DataStreams()[0].OpenDataStream()
             payload_size = remote_nodemap.FindNode("PayloadSize").Value()
+            buffers = []
             for _ in range(data_stream.NumBuffersAnnouncedMinRequired()):
                 buffer = data_stream.AllocAndAnnounceBuffer(payload_size)
                 data_stream.QueueBuffer(buffer)
+                buffers.append(buffer)
+            pixel_format = remote_nodemap.FindNode("PixelFormat").CurrentEntry().SymbolicValue()
+            bayer_views = self.map_bayer_buffers(buffers, bayer_shape, payload_size, pixel_format)
 
             remote_nodemap.FindNode("TLParamsLocked").SetValue(1)
             data_stream.StartAcquisition()
@@ -81,32 +329,48 @@ class IDSStream:
             remote_nodemap.FindNode("AcquisitionStart").WaitUntilDone()
 
             print("Camera stream started.")
+            print(f"OpenCV CPU features: {cv2.getCPUFeaturesLine()}")
+
+            # Resolve everything needed per frame once, outside of the loop (GenICam node lookups and attribute lookups)
+            chunk_timestamp = remote_nodemap.FindNode("ChunkTimestamp")
+            update_chunk_nodes = remote_nodemap.UpdateChunkNodes
+            wait_for_finished_buffer = data_stream.WaitForFinishedBuffer
+            queue_buffer = data_stream.QueueBuffer
+            buffer_to_image = ids_peak_ipl_extension.BufferToImage
+            demosaic = {"cpu": self.demosaic_cpu, "cuda": self.demosaic_cuda, "numba": self.demosaic_numba}[self.backend]
+            frame_buffers = self.frame_buffers
+            timestamps = self.timestamps
+            publish_idx = self.publish_idx
+            unread = self.unread
+            skip_unread = self.skip_unread
+            is_running = running.is_set
+            parent_alive = mp.parent_process().is_alive # Stop as well if the consumer died without calling stop()
+            write_idx = 0
 
-            while self.running:
-                try:
+            try:
+                while is_running() and parent_alive():
                     # Process image data
-                    buffer = data_stream.WaitForFinishedBuffer(1000)
-                    remote_nodemap.UpdateChunkNodes(buffer)
-                    frame = ids_peak_ipl_extension.BufferToImage(buffer)
-                    frame = frame.get_numpy_2D()
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BAYER_BG2BGR) # Convert Bayer pattern to BGR format
-                    if self.resize:
-                        frame = cv2.resize(frame, self.resize, interpolation=cv2.INTER_LINEAR)
-                    self.frame = frame
-
-                    # Process timestamp
-                    timestamp = remote_nodemap.FindNode("ChunkTimestamp").Value()
-                    timestamp = timedelta(seconds=timestamp / 1e9)  # Convert nanoseconds to seconds
-                    if self.timing_offset is not None:
-                        timestamp = timestamp - self.timing_offset
-                    self.info['timestamp'] = timestamp
-                    self.info['is_test'] = False 
-
-                    # Queue the buffer for reuse
-                    data_stream.QueueBuffer(buffer)
-                except Exception as e:
-                    print(f"Streaming exception: {e}")
-                    break
+                    buffer = wait_for_finished_buffer(1000)
+                    if skip_unread and unread[0]:
+                        # Consumer is behind, discard the frame without demosaicing it
+                        queue_buffer(buffer)
+                        continue
+                    update_chunk_nodes(buffer)
+                    frame = bayer_views.get(int(buffer.BasePtr())) if bayer_views else None
+                    if frame is None: # Not a premapped buffer
+                        frame = buffer_to_image(buffer).get_numpy_2D()
+                    demosaic(frame, frame_buffers[write_idx])
+
+                    # Process timestamp and publish the slot
+                    timestamps[write_idx] = chunk_timestamp.Value()
+                    publish_idx[0] = write_idx
+                    unread[0] = 1
+                    write_idx = (write_idx + 1) % RING_SIZE
+
+                    # Queue the buffer for reuse, only now, as the zero-copy view reads the buffer memory in place
+                    queue_buffer(buffer)
+            except Exception as e:
+                print(f"Streaming exception: {e}")
 
             # Stop stream
             remote_nodemap.FindNode("AcquisitionStop").Execute()
@@ -116,28 +380,120 @@ class IDSStream:
             for buffer in data_stream.AnnouncedBuffers():
                 data_stream.RevokeBuffer(buffer)
             remote_nodemap.FindNode("TLParamsLocked").SetValue(0)
+            if self.backend == "cuda":
+                self.release_cuda()
 
         except Exception as e:
             print(f"Camera setup failed: {e}")
+            if self.shm is None:
+                conn.send(None)
 
         finally:
             ids_peak.Library.Close()
+            conn.close()
+            # Release the views into the shared memory before closing it
+            frame_buffers = timestamps = publish_idx = unread = None
+            self.frame_buffers = self.timestamps = self.publish_idx = self.unread = None
+            if self.shm is not None:
+                close_segment(self.shm)
             print("Camera stream stopped.")
     
-    def getnext(self, return_tensor=True):
+    def map_bayer_buffers(self, buffers, bayer_shape, payload_size, pixel_format):
         """
-        Returns the next frame and its metadata.
-        """    
-        frame = self.frame.copy()
-        info = self.info.copy()
-        if return_tensor:
-            frame = torch.from_numpy(frame).permute(2, 0, 1).cuda().float() / 255.0
-        return frame, info
-    
-    def get_image_size(self):
-        frame = self.getnext()[0]
-        return frame.shape[-2], frame.shape[-1]
+        Wraps the memory of the announced IDS buffers as numpy arrays without copying, keyed by their base address.
+        Returns None if the buffers don't expose their memory as integer address or don't hold 8 bit Bayer frames,
+        in which case the frames are copied out with BufferToImage.
+        """
+        n_bytes = bayer_shape[0] * bayer_shape[1]
+        if pixel_format != "BayerRG8" or payload_size < n_bytes:
+            return None
+        bayer_views = {}
+        try:
+            for buffer in buffers:
+                address = int(buffer.BasePtr())
+                memory = (ctypes.c_ubyte * n_bytes).from_address(address)
+                bayer_views[address] = np.frombuffer(memory, dtype=np.uint8).reshape(bayer_shape)
+        except (AttributeError, TypeError, ValueError, OverflowError) as e:
+            print(f"Buffer memory can't be mapped ({e}), copying the frames with BufferToImage instead.")
+            return None
+        return bayer_views
 
-    def stop(self):
-        self.running = False
-        self.thread.join()
+    def allocate_frame_buffers(self, bayer_shape, conn):
+        """
+        Maps the shared ring of output frames and allocates the intermediates, so that no allocations happen while streaming.
+        """
+        shape = self.resize[::-1] if self.resize else bayer_shape
+        if self.color_mode == "bgr":
+            shape = (*shape, 3)
+        conn.send(tuple(shape))
+        self.shm = shared_memory.SharedMemory(name=conn.recv())
+        self.timestamps, self.publish_idx, self.unread, frames = map_shared_ring(self.shm.buf, shape)
+        frame_buffers = list(frames)
+        if self.backend == "cuda":
+            for frame_buffer in frame_buffers:
+                cv2.cuda.registerPageLocked(frame_buffer)
+        self.frame_buffers = frame_buffers
+        if self.backend == "cpu" and self.resize:
+            self.full_res_buffer = np.empty(bayer_shape + shape[2:], dtype=np.uint8)
+        if self.backend == "numba":
+            self.numba_kernel = specialize_kernel(tuple(bayer_shape), tuple(shape), self.edge_aware)
+
+    def demosaic_cpu(self, frame, frame_buffer):
+        """
+        Converts the raw Bayer frame to BGR (or grayscale) and resizes it on the CPU.
+        """
+        if self.resize:
+            cv2.demosaicing(frame, self.demosaic_code, dst=self.full_res_buffer)
+            if self.resizer == "kornia":
+                # kornia-rs has no destination argument, so its result is copied into the ring slot
+                frame_buffer[:] = kornia_rs.resize(self.full_res_buffer, frame_buffer.shape[:2], "bilinear")
+            else:
+                cv2.resize(self.full_res_buffer, self.resize, dst=frame_buffer, interpolation=cv2.INTER_LINEAR)
+        else:
+            cv2.demosaicing(frame, self.demosaic_code, dst=frame_buffer)
+
+    def demosaic_numba(self, frame, frame_buffer):
+        """
+        Converts the raw Bayer frame to BGR and resizes it on the CPU with a fused Numba kernel (or its NumPy fallback).
+        Note that the output pixels are sampled (nearest neighbor) instead of being interpolated bilinearly.
+        """
+        self.numba_kernel(frame, frame_buffer)
+
+    def setup_cuda(self):
+        """
+        Allocates the persistent CUDA stream and device buffers that are reused for every frame.
+        """
+        if cv2.cuda.getCudaEnabledDeviceCount() == 0:
+            raise RuntimeError("OpenCV was built without CUDA support or no CUDA device is available.")
+
+        # cv2.cuda names the Bayer patterns with R and B swapped, its edge-aware variant is Malvar-He-Cutler
+        if self.color_mode == "gray":
+            self.cuda_demosaic_code = cv2.COLOR_BayerRG2GRAY
+        elif self.edge_aware:
+            self.cuda_demosaic_code = cv2.cuda.COLOR_BayerRG2BGR_MHT
+        else:
+            self.cuda_demosaic_code = cv2.COLOR_BayerRG2BGR
+        self.cuda_stream = cv2.cuda.Stream()
+        self.gpu_bayer = cv2.cuda_GpuMat()
+        self.gpu_full_res = cv2.cuda_GpuMat()
+        self.gpu_small = cv2.cuda_GpuMat()
+
+    def release_cuda(self):
+        for frame_buffer in self.frame_buffers:
+            cv2.cuda.unregisterPageLocked(frame_buffer)
+
+    def demosaic_cuda(self, frame, frame_buffer):
+        """
+        Converts the raw Bayer frame to BGR (or grayscale) and resizes it on the GPU.
+        Only the raw Bayer bytes are uploaded and only the (resized) output frame is downloaded.
+        """
+        stream = self.cuda_stream
+        self.gpu_bayer.upload(frame, stream)
+        cv2.cuda.demosaicing(self.gpu_bayer, self.cuda_demosaic_code, dst=self.gpu_full_res, stream=stream)
+        gpu_frame = self.gpu_full_res
+        if self.resize:
+            cv2.cuda.resize(self.gpu_full_res, self.resize, dst=self.gpu_small, interpolation=cv2.INTER_LINEAR, stream=stream)
+            gpu_frame = self.gpu_small
+
+        gpu_frame.download(stream, frame_buffer)
+        stream.waitForCompletion()
@@ -9,29 +9,43 @@ Author:
 import numpy as np
 from .NatNetSDK import NatNetClient
 from datetime import timedelta
-from collections import deque
 import time
 from scipy.spatial.transform import Rotation as R, RotationSpline
 from scipy.interpolate import CubicSpline
 import matplotlib.pyplot as plt
 import matplotlib.lines as mlines
+from ._scheduling import pin_thread
+
+# Layout of a row in the pose buffer. The pose is float32 (sub-millimeter precision is ample for the mocap poses),
+# the timestamp stays float64, as float32 seconds would lose precision after a few hours of Motive uptime.
+# All fields are in one record, so that a row is written and copied in a single operation and readers never see torn rows.
+POSE_DTYPE = np.dtype([
+    ('timestamp', np.float64), # Raw Motive timestamp in seconds, the timing offset is applied when reading
+    ('mean_error', np.float64),
+    ('position', np.float32, 3), # x, y, z
+    ('rotation', np.float32, 4), # qx, qy, qz, qw
+    ('tracking_valid', np.bool_),
+], align=True)
 
 class MoCapStream:
     """
     A class to stream motion capture data from a NatNet server.
     """
 
-    def __init__(self, client_ip, server_ip, rigid_body_id, buffer_size):
+    def __init__(self, client_ip, server_ip, rigid_body_id, buffer_size, mocap_cores=None):
         # Member variables to control the streaming
         self.client_ip = client_ip
         self.server_ip = server_ip
         self.rigid_body_id = rigid_body_id
         self.buffer_size = buffer_size
+        self.mocap_cores = mocap_cores # Core(s) the NatNet threads are pinned to, should differ from the camera cores
 
         # Member variables to buffer the data
+        # The poses are stored in preallocated ring buffers with one row per pose, which are updated in place
         self.timing_offset = None
-        self.timestamp = None # Extra member needed because timestamp is retrieved via another listener
-        self.pose_buffer = deque(maxlen=self.buffer_size)
+        self.timestamp = None # Extra member needed because timestamp is retrieved via another listener, raw float seconds
+        self.pose_buffer = np.zeros(self.buffer_size, dtype=POSE_DTYPE)
+        self.pose_count = 0 # Total number of received poses, the latest one is in row (pose_count - 1) % buffer_size
         
         # Initialize the NatNet client
         self.client = NatNetClient()
@@ -42,6 +56,10 @@ class MoCapStream:
                                         # Addionally, comment out line 1663 in NatNetClient.py
         if not self.client.run("d"):
             raise RuntimeError("Failed to start NatNet client.")
+        if self.mocap_cores is not None:
+            for thread in (self.client.data_thread, self.client.command_thread):
+                if thread.is_alive():
+                    pin_thread(thread.native_id, self.mocap_cores)
         
         # Set up listeners for rigid_bodies and frames (needed for time sync) --> No threading needed because the NatNet client handles this internally
         self.client.rigid_body_listener = self.rigid_body_listener
@@ -50,47 +68,48 @@ class MoCapStream:
         time.sleep(1) # Allow some time for the client to connect and start receiving data
 
     def start_timing(self):
-        self.timing_offset = self.pose_buffer[-1]['timestamp']
+        if self.pose_count == 0:
+            raise RuntimeError(f"No pose of rigid body {self.rigid_body_id} received yet.")
+        self.timing_offset = self.pose_buffer[(self.pose_count - 1) % self.buffer_size]['timestamp']
 
     def new_frame_listener(self, frame_data):
-        timestamp = frame_data.get('timestamp')
-        self.timestamp = timedelta(seconds=timestamp)
+        self.timestamp = frame_data.get('timestamp')
 
     def rigid_body_listener(self, rigid_body_id, position, rotation, marker_error, tracking_valid):
-        if rigid_body_id == self.rigid_body_id:
-
-            # Apply timing offset if set
-            if self.timing_offset is not None:
-                timestamp = self.timestamp - self.timing_offset
-            else:
-                timestamp = self.timestamp
-
-            self.pose_buffer.append({
-                'rigid_body_pose': {
-                    'position': list(position),
-                    'rotation': list(rotation),
-                    },
-                'timestamp': timestamp,
-                'mean_error': marker_error,
-                'tracking_valid': tracking_valid
-            })
-
-    def getnext(self):
-        return self.pose_buffer[-1].copy()
+        if rigid_body_id == self.rigid_body_id and self.timestamp is not None:
+            # Write the row in place and only then count it, so that no objects are created per pose
+            row = self.pose_count % self.buffer_size
+            self.pose_buffer[row] = (self.timestamp, marker_error, position, rotation, tracking_valid)
+            self.pose_count += 1
+
+    def getnext(self, as_dict=True):
+        """
+        Returns the latest pose, either as dict or as a copy of its pose buffer row (a record of POSE_DTYPE).
+        """
+        if self.pose_count == 0:
+            raise RuntimeError(f"No pose of rigid body {self.rigid_body_id} received yet.")
+        row = (self.pose_count - 1) % self.buffer_size
+        pose = self.pose_buffer[row:row + 1].copy()[0] # Slice copy, as a single record would be a view into the buffer
+        if self.timing_offset is not None:
+            pose['timestamp'] -= self.timing_offset
+        if not as_dict:
+            return pose
+        return {
+            'rigid_body_pose': {
+                'position': pose['position'].tolist(),
+                'rotation': pose['rotation'].tolist(),
+                },
+            'timestamp': timedelta(seconds=float(pose['timestamp'])),
+            'mean_error': pose['mean_error'],
+            'tracking_valid': bool(pose['tracking_valid'])
+        }
     
     def wait_for_n_poses(self, n):
         """
         Waits until the buffer has at least n future poses.
         """
-        future_poses_cnt = 0
-        last_mocap_ts = self.pose_buffer[-1]['timestamp'].total_seconds()
-        while True:
-            current_mocap_ts = self.pose_buffer[-1]['timestamp'].total_seconds()
-            if current_mocap_ts > last_mocap_ts:
-                future_poses_cnt += 1
-                last_mocap_ts = current_mocap_ts
-            if future_poses_cnt >= n:
-                break
+        target_count = self.pose_count + n
+        while self.pose_count < target_count:
             time.sleep(0.001)
     
     def get_interpolated_pose(self, query_time, marker_error_threshold, show_plot=False):
@@ -106,29 +125,32 @@ class MoCapStream:
             numpy.ndarray: The interpolated rotation as a quaternion.
         """
         self.wait_for_n_poses(n=self.buffer_size // 2) # Ensure the buffer has enough poses to match
-        current_buffer = self.pose_buffer.copy() # Get the current buffer of mocap data
-        
+        n_poses = min(self.pose_count, self.buffer_size)
+        current_poses = self.pose_buffer[:n_poses].copy() # Get the current buffer of mocap data
+
         # Filter the buffer for valid mocap data based on tracking validity and marker error threshold
-        interest_buffer = []
-        for data in current_buffer:
-            if data['tracking_valid'] and data['mean_error'] < marker_error_threshold:
-                interest_buffer.append(data)
+        interest_mask = current_poses['tracking_valid'] & (current_poses['mean_error'] < marker_error_threshold)
+        interest_poses = current_poses[interest_mask]
 
-        if len(interest_buffer) < 5:
+        if len(interest_poses) < 5:
             return None, None, None, None
-        
+
+        # Sort the ring buffer rows chronologically
+        interest_poses = interest_poses[np.argsort(interest_poses['timestamp'])]
+
         # Extract times, positions, and rotations from the buffer
-        times = [data['timestamp'].total_seconds() for data in interest_buffer]
-        positions = [data['rigid_body_pose']['position'] for data in interest_buffer]
-        rotations = [data['rigid_body_pose']['rotation'] for data in interest_buffer]
+        times = interest_poses['timestamp']
+        if self.timing_offset is not None:
+            times = times - self.timing_offset
+        positions = interest_poses['position']
+        rotations = interest_poses['rotation']
 
         # Create Translation-Splines (one for each xyz-dim) from valid buffer
-        positions_plot = positions.copy()
-        positions = np.array(positions).T
-        pos_splines = [CubicSpline(times, positions[dim]) for dim in range(3)]
+        positions_plot = positions
+        pos_splines = [CubicSpline(times, positions[:, dim]) for dim in range(3)]
 
         # Create Rotation-Spline from valid buffer
-        rotations_plot = rotations.copy()
+        rotations_plot = rotations
         rotations = R.from_quat(rotations)
         rot_spline = RotationSpline(times, rotations)
 